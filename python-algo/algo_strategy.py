@@ -19,6 +19,20 @@ Advanced strategy tips:
   the actual current map state.
 """
 
+# Set to True to print the debug messages written every turn and from action frames
+DEBUG = False
+
+# Reused by on_action_frame to decode only the part of a frame it needs
+JSON_DECODER = json.JSONDecoder()
+
+# Hardcoded build locations used every turn by the starter strategy, allocated once at import
+TURRET_LOCATIONS = ([0, 13], [27, 13], [8, 11], [19, 11], [13, 11], [14, 11])
+WALL_LOCATIONS = ([8, 12], [19, 12])
+SUPPORT_LOCATIONS = ([13, 2], [14, 2], [13, 3], [14, 3])
+SCOUT_SPAWN_LOCATION_OPTIONS = ([13, 0], [14, 0])
+# The line of structures demolisher_line_strategy builds, from right to left
+DEMOLISHER_LINE = tuple([x, 11] for x in range(27, 5, -1))
+
 class AlgoStrategy(gamelib.AlgoCore):
     def __init__(self):
         super().__init__()
@@ -43,6 +57,17 @@ class AlgoStrategy(gamelib.AlgoCore):
         SP = 0
         # This is a good place to do initial setup
         self.scored_on_locations = []
+        # The same locations as scored_on_locations, as (x, y) tuples for fast duplicate checks
+        self.scored_on_set = set()
+        # Structure costs never change during a game, so find the cheapest one up front.
+        # Structures are paid for with SP, which the config calls cost1
+        structure_costs = {unit["shorthand"]: unit.get("cost1", 0) for unit in config["unitInformation"][:3]}
+        self.cheapest_stationary_unit = min([WALL, TURRET, SUPPORT], key=lambda unit: structure_costs[unit])
+        # Base stats for every unit type, filled in on the first turn since GameUnit needs a GameState to exist
+        self.unit_stats = None
+        # Our edges never change during a game, so build the list of them once
+        game_map = gamelib.GameMap(config)
+        self.friendly_edges = game_map.get_edge_locations(game_map.BOTTOM_LEFT) + game_map.get_edge_locations(game_map.BOTTOM_RIGHT)
 
     def on_turn(self, turn_state):
         """
@@ -53,8 +78,16 @@ class AlgoStrategy(gamelib.AlgoCore):
         game engine.
         """
         game_state = gamelib.GameState(self.config, turn_state)
-        gamelib.debug_write('Performing turn {} of your custom algo strategy'.format(game_state.turn_number))
+        if DEBUG:
+            gamelib.debug_write('Performing turn {} of your custom algo strategy'.format(game_state.turn_number))
         game_state.suppress_warnings(True)  #Comment or remove this line to enable warnings.
+        if self.unit_stats is None:
+            self.unit_stats = {unit: gamelib.GameUnit(unit, self.config) for unit in [WALL, SUPPORT, TURRET, SCOUT, DEMOLISHER, INTERCEPTOR]}
+        # Enemy structures and the locations they can attack are indexed the first time they are needed this turn
+        self.enemy_structures = None
+        self.attacker_counts = None
+        # Paths are only valid for the board they were computed on, so start each turn fresh
+        self.path_cache = {}
 
         self.starter_strategy(game_state)
 
@@ -93,13 +126,13 @@ class AlgoStrategy(gamelib.AlgoCore):
                 # Sending more at once is better since attacks can only hit a single scout at a time
                 if game_state.turn_number % 2 == 1:
                     # To simplify we will just check sending them from back left and right
-                    scout_spawn_location_options = [[13, 0], [14, 0]]
-                    best_location = self.least_damage_spawn_location(game_state, scout_spawn_location_options)
-                    game_state.attempt_spawn(SCOUT, best_location, 1000)
+                    best_location = self.least_damage_spawn_location(game_state, SCOUT_SPAWN_LOCATION_OPTIONS)
+                    num_scouts = game_state.number_affordable(SCOUT)
+                    if num_scouts:
+                        game_state.attempt_spawn(SCOUT, best_location, num_scouts)
 
                 # Lastly, if we have spare SP, let's build some supports
-                support_locations = [[13, 2], [14, 2], [13, 3], [14, 3]]
-                game_state.attempt_spawn(SUPPORT, support_locations)
+                game_state.attempt_spawn(SUPPORT, SUPPORT_LOCATIONS)
 
     def build_defences(self, game_state):
         """
@@ -110,15 +143,13 @@ class AlgoStrategy(gamelib.AlgoCore):
         # More community tools available at: https://terminal.c1games.com/rules#Download
 
         # Place turrets that attack enemy units
-        turret_locations = [[0, 13], [27, 13], [8, 11], [19, 11], [13, 11], [14, 11]]
         # attempt_spawn will try to spawn units if we have resources, and will check if a blocking unit is already there
-        game_state.attempt_spawn(TURRET, turret_locations)
+        game_state.attempt_spawn(TURRET, TURRET_LOCATIONS)
         
         # Place walls in front of turrets to soak up damage for them
-        wall_locations = [[8, 12], [19, 12]]
-        game_state.attempt_spawn(WALL, wall_locations)
+        game_state.attempt_spawn(WALL, WALL_LOCATIONS)
         # upgrade walls so they soak more damage
-        game_state.attempt_upgrade(wall_locations)
+        game_state.attempt_upgrade(WALL_LOCATIONS)
 
     def build_reactive_defense(self, game_state):
         """
@@ -126,27 +157,29 @@ class AlgoStrategy(gamelib.AlgoCore):
         We can track where the opponent scored by looking at events in action frames 
         as shown in the on_action_frame function
         """
-        for location in self.scored_on_locations:
-            # Build turret one space above so that it doesn't block our own edge spawn locations
-            build_location = [location[0], location[1]+1]
-            game_state.attempt_spawn(TURRET, build_location)
+        # Build turret one space above so that it doesn't block our own edge spawn locations
+        # on_action_frame only records each location once, so these are already unique
+        build_locations = [[location[0], location[1]+1] for location in self.scored_on_locations]
+        if build_locations:
+            game_state.attempt_spawn(TURRET, build_locations)
 
     def stall_with_interceptors(self, game_state):
         """
         Send out interceptors at random locations to defend our base from enemy moving units.
         """
-        # We can spawn moving units on our edges so a list of all our edge locations
-        friendly_edges = game_state.game_map.get_edge_locations(game_state.game_map.BOTTOM_LEFT) + game_state.game_map.get_edge_locations(game_state.game_map.BOTTOM_RIGHT)
-        
+        # We can spawn moving units on our edges, so start from the list of all our edge locations
         # Remove locations that are blocked by our own structures 
         # since we can't deploy units there.
-        deploy_locations = self.filter_blocked_locations(friendly_edges, game_state)
+        deploy_locations = self.filter_blocked_locations(self.friendly_edges, game_state)
         
-        # While we have remaining MP to spend lets send out interceptors randomly.
-        while game_state.get_resource(MP) >= game_state.type_cost(INTERCEPTOR)[MP] and len(deploy_locations) > 0:
+        if len(deploy_locations) == 0:
+            return
+
+        # Spend all our remaining MP on interceptors sent out randomly.
+        # Their cost is fixed, so work out how many we can afford once instead of re-checking every spawn.
+        for _ in range(game_state.number_affordable(INTERCEPTOR)):
             # Choose a random deploy location.
-            deploy_index = random.randint(0, len(deploy_locations) - 1)
-            deploy_location = deploy_locations[deploy_index]
+            deploy_location = random.choice(deploy_locations)
             
             game_state.attempt_spawn(INTERCEPTOR, deploy_location)
             """
@@ -158,23 +191,17 @@ class AlgoStrategy(gamelib.AlgoCore):
         """
         Build a line of the cheapest stationary unit so our demolisher can attack from long range.
         """
-        # First let's figure out the cheapest unit
-        # We could just check the game rules, but this demonstrates how to use the GameUnit class
-        stationary_units = [WALL, TURRET, SUPPORT]
-        cheapest_unit = WALL
-        for unit in stationary_units:
-            unit_class = gamelib.GameUnit(unit, game_state.config)
-            if unit_class.cost[game_state.MP] < gamelib.GameUnit(cheapest_unit, game_state.config).cost[game_state.MP]:
-                cheapest_unit = unit
-
-        # Now let's build out a line of stationary units. This will prevent our demolisher from running into the enemy base.
+        # Let's build out a line of the cheapest stationary unit, which was worked out in on_game_start. 
+        # This will prevent our demolisher from running into the enemy base.
         # Instead they will stay at the perfect distance to attack the front two rows of the enemy base.
-        for x in range(27, 5, -1):
-            game_state.attempt_spawn(cheapest_unit, [x, 11])
+        game_state.attempt_spawn(self.cheapest_stationary_unit, DEMOLISHER_LINE)
 
         # Now spawn demolishers next to the line
-        # By asking attempt_spawn to spawn 1000 units, it will essentially spawn as many as we have resources for
-        game_state.attempt_spawn(DEMOLISHER, [24, 10], 1000)
+        # Spawn as many as we have resources for, asking for exactly that many so attempt_spawn doesn't
+        # have to fail a spawn to find out we are out of MP
+        num_demolishers = game_state.number_affordable(DEMOLISHER)
+        if num_demolishers:
+            game_state.attempt_spawn(DEMOLISHER, [24, 10], num_demolishers)
 
     def least_damage_spawn_location(self, game_state, location_options):
         """
@@ -183,33 +210,83 @@ class AlgoStrategy(gamelib.AlgoCore):
         estimate the path's damage risk.
         """
         damages = []
+        turret_damage = self.unit_stats[TURRET].damage_i
+        attacker_counts = self.get_attacker_counts(game_state)
         # Get the damage estimate each path will take
         for location in location_options:
-            path = game_state.find_path_to_edge(location)
-            damage = 0
-            for path_location in path:
-                # Get number of enemy turrets that can attack each location and multiply by turret damage
-                damage += len(game_state.get_attackers(path_location, 0)) * gamelib.GameUnit(TURRET, game_state.config).damage_i
-            damages.append(damage)
+            path = self.get_path(game_state, location)
+            # Add up the number of enemy turrets that can attack each location and multiply by turret damage
+            damages.append(sum(attacker_counts[path_x][path_y] for path_x, path_y in path) * turret_damage)
         
         # Now just return the location that takes the least damage
         return location_options[damages.index(min(damages))]
 
+    def get_attacker_counts(self, game_state):
+        """
+        Returns a grid where attacker_counts[x][y] is the number of enemy structures that can attack [x, y].
+        Each attacker marks every location in its range once, so looking up a location afterwards 
+        is constant time instead of a search of the map around it like get_attackers does.
+        Like get_enemy_structures, this is only built once per turn.
+        """
+        if self.attacker_counts is not None:
+            return self.attacker_counts
+        # Indexing nested lists by x and y avoids building a tuple key for every lookup
+        attacker_counts = [[0] * game_state.ARENA_SIZE for _ in range(game_state.ARENA_SIZE)]
+        # Offsets covered by each attack range, so attackers with the same range share one footprint
+        footprints = {}
+        for unit in self.get_enemy_structures(game_state):
+            if unit.damage_i + unit.damage_f <= 0:
+                continue
+            if unit.attackRange not in footprints:
+                reach = math.floor(unit.attackRange)
+                footprints[unit.attackRange] = [(dx, dy) for dx in range(-reach, reach + 1) for dy in range(-reach, reach + 1) if dx ** 2 + dy ** 2 <= unit.attackRange ** 2]
+            for dx, dy in footprints[unit.attackRange]:
+                x, y = unit.x + dx, unit.y + dy
+                if 0 <= x < game_state.ARENA_SIZE and 0 <= y < game_state.ARENA_SIZE:
+                    attacker_counts[x][y] += 1
+        self.attacker_counts = attacker_counts
+        return attacker_counts
+
+    def get_path(self, game_state, location):
+        """
+        Gets the path a unit spawned at location would take, reusing paths already found this turn.
+        Pathfinding is the slowest call we make, but cached paths don't see structures placed 
+        after they were found, so only use this once this turn's building is done.
+        """
+        key = (location[0], location[1])
+        if key not in self.path_cache:
+            self.path_cache[key] = game_state.find_path_to_edge(location)
+        return self.path_cache[key]
+
+    def get_enemy_structures(self, game_state):
+        """
+        Returns a list of the enemy structures on the board this turn.
+        The enemy can't build during our turn, so the map is only scanned once 
+        per turn and later queries reuse the cached list.
+        """
+        if self.enemy_structures is None:
+            self.enemy_structures = []
+            # Enemy structures can only be on their half, so only visit the rows of the top half.
+            # Each row y of it spans x = y - HALF_ARENA to ARENA_SIZE + HALF_ARENA - y - 1
+            for y in range(game_state.HALF_ARENA, game_state.ARENA_SIZE):
+                for x in range(y - game_state.HALF_ARENA, game_state.ARENA_SIZE + game_state.HALF_ARENA - y):
+                    for unit in game_state.game_map[x, y]:
+                        if unit.stationary and unit.player_index == 1:
+                            self.enemy_structures.append(unit)
+        return self.enemy_structures
+
     def detect_enemy_unit(self, game_state, unit_type=None, valid_x = None, valid_y = None):
+        # Callers pass lists, so convert them to sets once rather than scanning them for every unit
+        valid_x = None if valid_x is None else set(valid_x)
+        valid_y = None if valid_y is None else set(valid_y)
         total_units = 0
-        for location in game_state.game_map:
-            if game_state.contains_stationary_unit(location):
-                for unit in game_state.game_map[location]:
-                    if unit.player_index == 1 and (unit_type is None or unit.unit_type == unit_type) and (valid_x is None or location[0] in valid_x) and (valid_y is None or location[1] in valid_y):
-                        total_units += 1
+        for unit in self.get_enemy_structures(game_state):
+            if (unit_type is None or unit.unit_type == unit_type) and (valid_x is None or unit.x in valid_x) and (valid_y is None or unit.y in valid_y):
+                total_units += 1
         return total_units
         
     def filter_blocked_locations(self, locations, game_state):
-        filtered = []
-        for location in locations:
-            if not game_state.contains_stationary_unit(location):
-                filtered.append(location)
-        return filtered
+        return [location for location in locations if not game_state.contains_stationary_unit(location)]
 
     def on_action_frame(self, turn_string):
         """
@@ -218,19 +295,29 @@ class AlgoStrategy(gamelib.AlgoCore):
         Processing the action frames is complicated so we only suggest it if you have time and experience.
         Full doc on format of a game frame at in json-docs.html in the root of the Starterkit.
         """
+        # Most frames have no breaches, so skip parsing the whole frame when the breach list is empty
+        if '"breach":[]' in turn_string:
+            return
         # Let's record at what position we get scored on
-        state = json.loads(turn_string)
-        events = state["events"]
-        breaches = events["breach"]
+        # We only need the breach list, so decode it on its own instead of the whole frame
+        breach_key = turn_string.find('"breach"')
+        if breach_key == -1:
+            return
+        breaches, _ = JSON_DECODER.raw_decode(turn_string, turn_string.index('[', breach_key))
         for breach in breaches:
-            location = breach[0]
-            unit_owner_self = True if breach[4] == 1 else False
             # When parsing the frame data directly, 
             # 1 is integer for yourself, 2 is opponent (StarterKit code uses 0, 1 as player_index instead)
-            if not unit_owner_self:
+            if breach[4] == 1:
+                continue
+            location = breach[0]
+            if DEBUG:
                 gamelib.debug_write("Got scored on at: {}".format(location))
+            # Only remember each location once so the list stays small over a long game
+            if (location[0], location[1]) not in self.scored_on_set:
+                self.scored_on_set.add((location[0], location[1]))
                 self.scored_on_locations.append(location)
-                gamelib.debug_write("All locations: {}".format(self.scored_on_locations))
+                if DEBUG:
+                    gamelib.debug_write("All locations: {}".format(self.scored_on_locations))
 
 
 if __name__ == "__main__":
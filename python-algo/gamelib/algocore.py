@@ -3,6 +3,9 @@ import json
 from .game_state import GameState
 from .util import get_command, debug_write, BANNER_TEXT, send_command
 
+# Used to decode a single value out of a game state string without parsing all of it
+_json_decoder = json.JSONDecoder()
+
 class AlgoCore(object):
     """
     This class handles communication with the game engine. \n
@@ -64,8 +67,11 @@ class AlgoCore(object):
                 parsed_config = json.loads(game_state_string)
                 self.on_game_start(parsed_config)
             elif "turnInfo" in game_state_string:
-                state = json.loads(game_state_string)
-                stateType = int(state.get("turnInfo")[0])
+                # Action frames arrive hundreds of times a turn and only turnInfo is needed to route them,
+                # so decode just that list rather than the whole string
+                turn_info_start = game_state_string.index('[', game_state_string.index('"turnInfo"'))
+                turn_info, _ = _json_decoder.raw_decode(game_state_string, turn_info_start)
+                stateType = int(turn_info[0])
                 if stateType == 0:
                     """
                     This is the game turn game state message. Algo must now print to stdout 2 lines, one for build phase one for
@@ -20,6 +20,14 @@ class GameMap:
         * BOTTOM_RIGHT (int): A constant that represents the bottom right edge
 
     """
+    # Every location on the board in the order iteration visits them, bottom row first. 
+    # The board shape never changes so this is shared by all maps.
+    _arena_locations = None
+    # The same locations as a set, so bounds checks are a single lookup
+    _arena_location_set = None
+    # The locations along each edge, in the order get_edges returns them. Also shared by all maps.
+    _edge_locations = None
+
     def __init__(self, config):
         """Initializes constants and game map
 
@@ -36,7 +44,11 @@ class GameMap:
         self.BOTTOM_LEFT = 2
         self.BOTTOM_RIGHT = 3
         self.__map = self.__empty_grid()
-        self.__start = [13,0]
+        if GameMap._arena_locations is None:
+            GameMap._arena_locations = [(x, y) for y in range(self.ARENA_SIZE) for x in range(self.ARENA_SIZE) if self.__in_diamond(x, y)]
+            GameMap._arena_location_set = set(GameMap._arena_locations)
+        if GameMap._edge_locations is None:
+            GameMap._edge_locations = self.__build_edges()
     
     def __getitem__(self, location):
         if len(location) == 2 and self.in_arena_bounds(location):
@@ -51,21 +63,8 @@ class GameMap:
         self._invalid_coordinates(location)
 
     def __iter__(self):
-        self.__start = [13,0]
-        return self
-    
-    def __next__(self):
-        location = self.__start
-        if location == [15,27]:
-            raise StopIteration
-        new_location = [location[0]+1, location[1]]
-        while not self.in_arena_bounds(new_location) and not location == [14,27]:
-            if new_location[0] == self.ARENA_SIZE:
-                new_location = [0, new_location[1]+1]
-            else:
-                new_location = [new_location[0]+1, new_location[1]]
-        self.__start = new_location
-        return location 
+        # Hand out new lists so callers can't modify the shared location cache
+        return ([x, y] for x, y in GameMap._arena_locations)
 
     def __empty_grid(self):
         grid = []
@@ -88,7 +87,13 @@ class GameMap:
             True if the location is on the board, False otherwise
         
         """
+        # Pathfinding calls this for every neighbor it looks at, so use the precomputed board instead of recalculating
         x, y = location
+        return (x, y) in GameMap._arena_location_set
+
+    def __in_diamond(self, x, y):
+        """Works out whether x, y is inside the diamond shaped game board. Used to build the location caches.
+        """
         half_board = self.HALF_ARENA
 
         row_size = y + 1
@@ -117,8 +122,8 @@ class GameMap:
             self.warn("Passed invalid quadrant_description '{}'. See the documentation for valid inputs for get_edge_locations.".format(quadrant_description))
             return
 
-        edges = self.get_edges()
-        return edges[quadrant_description]
+        # Hand out new lists so callers can't modify the shared edge cache
+        return [[x, y] for x, y in GameMap._edge_locations[quadrant_description]]
 
     def get_edges(self):
         """Gets all of the edges and their edge locations
@@ -127,26 +132,31 @@ class GameMap:
             A list with four lists inside of it of locations corresponding to the four edges.
             [0] = top_right, [1] = top_left, [2] = bottom_left, [3] = bottom_right.
         """
+        return [[[x, y] for x, y in edge] for edge in GameMap._edge_locations]
+
+    def __build_edges(self):
+        """Works out the locations along each edge as (x, y) tuples, in the same order as get_edges
+        """
         top_right = []
         for num in range(0, self.HALF_ARENA):
             x = self.HALF_ARENA + num
             y = self.ARENA_SIZE - 1 - num
-            top_right.append([int(x), int(y)])
+            top_right.append((int(x), int(y)))
         top_left = []
         for num in range(0, self.HALF_ARENA):
             x = self.HALF_ARENA - 1 - num
             y = self.ARENA_SIZE - 1 - num
-            top_left.append([int(x), int(y)])
+            top_left.append((int(x), int(y)))
         bottom_left = []
         for num in range(0, self.HALF_ARENA):
             x = self.HALF_ARENA - 1 - num
             y = num
-            bottom_left.append([int(x), int(y)])
+            bottom_left.append((int(x), int(y)))
         bottom_right = []
         for num in range(0, self.HALF_ARENA):
             x = self.HALF_ARENA + num
             y = num
-            bottom_right.append([int(x), int(y)])
+            bottom_right.append((int(x), int(y)))
         return [top_right, top_left, bottom_left, bottom_right]
     
     def add_unit(self, unit_type, location, player_index=0):
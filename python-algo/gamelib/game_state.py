@@ -89,7 +89,13 @@ class GameState:
         MP = self.MP
         SP = self.SP
 
+        # The longest attack range of any unit type, used to bound the search in get_attackers
+        self._max_attack_range = max([0] + [unit.get('attackRange', 0) for unit in config["unitInformation"]])
+
         self.game_map = GameMap(self.config)
+        # Set of (x, y) tuples along our two edges, used for constant time checks in can_spawn
+        edges = self.game_map.get_edges()
+        self._friendly_edge_locations = set(map(tuple, edges[self.game_map.BOTTOM_LEFT] + edges[self.game_map.BOTTOM_RIGHT]))
         self._shortest_path_finder = ShortestPathFinder()
         self._build_stack = []
         self._deploy_stack = []
@@ -140,11 +146,13 @@ class GameState:
                 # This depends on RM and UP always being the last types to be processed
                 if unit_type == REMOVE:
                     # Quick fix will deploy engine fix soon
-                    if self.contains_stationary_unit([x,y]):
-                        self.game_map[x,y][0].pending_removal = True
+                    existing_unit = self.contains_stationary_unit([x,y])
+                    if existing_unit:
+                        existing_unit.pending_removal = True
                 elif unit_type == UPGRADE:
-                    if self.contains_stationary_unit([x,y]):
-                        self.game_map[x,y][0].upgrade()
+                    existing_unit = self.contains_stationary_unit([x,y])
+                    if existing_unit:
+                        existing_unit.upgrade()
                 else:
                     unit = GameUnit(unit_type, self.config, player_number, hp, x, y)
                     self.game_map[x,y].append(unit)
@@ -329,11 +337,16 @@ class GameState:
                 self.warn("Could not spawn {} at location {}. Location invalid.".format(unit_type, location))
             return False
 
-        affordable = self.number_affordable(unit_type) >= num
         stationary = is_stationary(unit_type)
         blocked = self.contains_stationary_unit(location) or (stationary and len(self.game_map[location[0],location[1]]) > 0)
         correct_territory = location[1] < self.HALF_ARENA
-        on_edge = location in (self.game_map.get_edge_locations(self.game_map.BOTTOM_LEFT) + self.game_map.get_edge_locations(self.game_map.BOTTOM_RIGHT))
+        on_edge = (location[0], location[1]) in self._friendly_edge_locations
+
+        # Strategies often retry locations that are already built on every turn. When there is no warning to
+        # print we can reject those without also working out whether the unit is affordable
+        if not self.enable_warnings and (blocked or not correct_territory or not (stationary or on_edge)):
+            return False
+        affordable = self.number_affordable(unit_type) >= num
 
         if self.enable_warnings:
             fail_reason = ""
@@ -374,15 +387,16 @@ class GameState:
         if type(locations[0]) == int:
             locations = [locations]
         spawned_units = 0
+        costs = self.type_cost(unit_type)
+        stationary = is_stationary(unit_type)
         for location in locations:
             for i in range(num):
                 if self.can_spawn(unit_type, location, 1):
                     x, y = map(int, location)
-                    costs = self.type_cost(unit_type)
                     self.__set_resource(SP, 0 - costs[SP])
                     self.__set_resource(MP, 0 - costs[MP])
                     self.game_map.add_unit(unit_type, location, 0)
-                    if is_stationary(unit_type):
+                    if stationary:
                         self._build_stack.append((unit_type, x, y))
                     else:
                         self._deploy_stack.append((unit_type, x, y))
@@ -432,13 +446,10 @@ class GameState:
             locations = [locations]
         spawned_units = 0
         for location in locations:
-            if location[1] < self.HALF_ARENA and self.contains_stationary_unit(location):
+            # contains_stationary_unit returns the structure itself, so there is no need to search the location again
+            existing_unit = location[1] < self.HALF_ARENA and self.contains_stationary_unit(location)
+            if existing_unit:
                 x, y = map(int, location)
-                existing_unit = None
-                for unit in self.game_map[x,y]:
-                    if unit.stationary:
-                        existing_unit = unit
-
                 if not existing_unit.upgraded and self.config["unitInformation"][UNIT_TYPE_TO_INDEX[existing_unit.unit_type]].get("upgrade", None) is not None:
                     costs = self.type_cost(existing_unit.unit_type, True)
                     resources = self.get_resources()
@@ -565,11 +576,12 @@ class GameState:
 
         for location in possible_locations:
             for unit in self.game_map[location]:
-                if unit.player_index == attacking_unit.player_index or (attacking_unit.damage_f == 0 and is_stationary(unit.unit_type)) or (attacking_unit.damage_i == 0 and not(is_stationary(unit.unit_type))):
+                # Use the stationary flag set when the unit was created rather than comparing type strings
+                unit_stationary = unit.stationary
+                if unit.player_index == attacking_unit.player_index or (attacking_unit.damage_f == 0 and unit_stationary) or (attacking_unit.damage_i == 0 and not unit_stationary):
                     continue
 
                 new_target = False
-                unit_stationary = unit.stationary
                 unit_distance = self.game_map.distance_between_locations(location, [attacking_unit.x, attacking_unit.y])
                 unit_health = unit.health
                 unit_y = unit.y
@@ -635,11 +647,7 @@ class GameState:
         """
         Get locations in the range of TURRET units
         """
-        max_range = 0
-        for unit in self.config["unitInformation"]:
-            if unit.get('attackRange', 0) >= max_range:
-                max_range = unit.get('attackRange', 0)
-        possible_locations= self.game_map.get_locations_in_range(location, max_range)
+        possible_locations= self.game_map.get_locations_in_range(location, self._max_attack_range)
         for location_unit in possible_locations:
             for unit in self.game_map[location_unit]:
                 if unit.damage_i + unit.damage_f > 0 and unit.player_index != player_index and self.game_map.distance_between_locations(location, location_unit) <= unit.attackRange:
@@ -71,9 +71,13 @@ class ShortestPathFinder:
         #Initialize map 
         self.initialize_map(game_state)
         #Fill in walls
-        for location in self.game_state.game_map:
-            if self.game_state.contains_stationary_unit(location):
-                self.game_map[location[0]][location[1]].blocked = True
+        #Iterating the map only gives valid locations, so read each tile directly instead of going through
+        #contains_stationary_unit, which repeats the bounds check on top of the one game_map[x, y] does
+        for x, y in self.game_state.game_map:
+            for unit in self.game_state.game_map[x, y]:
+                if unit.stationary:
+                    self.game_map[x][y].blocked = True
+                    break
         #Do pathfinding
         ideal_endpoints = self._idealness_search(start_point, end_points)
         self._validate(ideal_endpoints, end_points)
@@ -215,6 +215,14 @@ class BasicTests(unittest.TestCase):
         self.assertEqual([("DF", 13, 6)], game._build_stack, "Build queue is wrong!")
         self.assertEqual([("SI", 13, 0), ("SI", 13, 0), ("SI", 13, 0)], game._deploy_stack, "Deploy queue is wrong!")
 
+    def test_upgrading(self):
+        game = self.make_turn_0_map()
+        self.assertEqual(1, game.attempt_spawn("FF", [13, 6]), "We cannot spawn a wall!")
+        self.assertEqual(1, game.attempt_upgrade([13, 6]), "We cannot upgrade our wall!")
+        self.assertEqual(True, game.game_map[13,6][0].upgraded, "The wall on the map was not upgraded")
+        self.assertEqual(0, game.attempt_upgrade([[13, 6], [13, 7]]), "We upgraded the same wall twice, or a wall that doesn't exist")
+        self.assertEqual([("FF", 13, 6), ("UP", 13, 6)], game._build_stack, "Build queue is wrong!")
+
     def test_trivial_functions(self):
         game = self.make_turn_0_map()
 
@@ -225,6 +233,24 @@ class BasicTests(unittest.TestCase):
         self.assertEqual(0, len(game.game_map.get_locations_in_range([-500,-500], 10)), "Invalid tiles are being marked as in range")
         self.assertEqual(1, len(game.game_map.get_locations_in_range([13,13], 0)), "A location should be in range of itself")
     
+    def test_map_iteration(self):
+        game = self.make_turn_0_map()
+        locations = list(game.game_map)
+        self.assertEqual(420, len(locations), "Iterating the map should visit every valid tile once")
+        self.assertEqual([13, 0], locations[0], "Iteration should start at the bottom of the map")
+        locations[0][0] = -1
+        self.assertEqual([13, 0], next(iter(game.game_map)), "Changing a yielded location changed the map's locations")
+
+    def test_edge_locations(self):
+        game = self.make_turn_0_map()
+        bottom_left = game.game_map.get_edge_locations(game.game_map.BOTTOM_LEFT)
+        self.assertEqual(14, len(bottom_left), "Each edge should have 14 locations")
+        self.assertEqual([13, 0], bottom_left[0], "The bottom left edge should start at the bottom of the map")
+        self.assertEqual([0, 13], bottom_left[-1], "The bottom left edge should end at the left corner")
+        self.assertEqual(bottom_left, game.game_map.get_edges()[game.game_map.BOTTOM_LEFT], "get_edges and get_edge_locations disagree")
+        bottom_left[0][0] = -1
+        self.assertEqual([13, 0], game.game_map.get_edge_locations(game.game_map.BOTTOM_LEFT)[0], "Changing a returned edge changed the map's edges")
+
     def test_get_units(self):
         game = self.make_turn_0_map()
         self.assertEqual(0, len(game.game_map[13,13]), "There should not be a unit on this location")